@@ -8,17 +8,47 @@ and optionally providing live reload capabilities for development.
 """
 
 import argparse
-import html
+import collections
+import functools
 import http.server
 import json
 import os
 import re
-import socketserver
 import threading
 import time
-from typing import Dict, List, Optional
-
-from bs4 import BeautifulSoup
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
+from bs4.formatter import HTMLFormatter
+
+# Prefer the C-based lxml parser, falling back to the pure-Python html.parser
+# when lxml is not installed. BeautifulSoup only registers its lxml tree
+# builder when lxml.etree can actually be imported
+HTML_PARSER: str = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
+# Use kernel file change notifications (inotify, FSEvents, ...) through
+# watchdog when available, falling back to polling modification times
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE: bool = True
+except ImportError:
+    FileSystemEventHandler = object  # type: ignore[misc,assignment]
+    WATCHDOG_AVAILABLE = False
 
 
 # Mapping of file extensions to their corresponding language identifiers
@@ -46,39 +76,57 @@ extension_to_lang: Dict[str, str] = {
     # Add more as needed
 }
 
-# Threading event flag for coordinating browser reload signals
-# Uses polling approach instead of WebSocket for simplicity
-reload_flag: threading.Event = threading.Event()
-
-
-def inject_live_reload_script(html_content: str) -> str:
-    """
-    Inject a live reload polling script into the HTML content.
-
-    This function adds a JavaScript snippet that periodically polls the server
-    to check if a reload is needed. When a reload signal is detected, the page
-    automatically refreshes.
-
-    Args:
-        html_content: The HTML content to inject the script into.
-
-    Returns:
-        The modified HTML content with the live reload script injected before
-        the closing </body> tag.
-    """
-    # JavaScript that polls the server every second to check for reload signals
-    live_reload_script = """
+# Precompiled pattern for rewriting relative (./) paths in src, data-load and
+# data-load-code attributes in a single pass over the slide HTML
+_REL_PATH_RE: Pattern[str] = re.compile(r'(data-load-code|data-load|src)="\./([^"]*)"')
+
+# Precompiled pattern detecting an explicit <body> tag in included HTML
+_BODY_TAG_RE: Pattern[str] = re.compile(r"<body[\s>]", re.IGNORECASE)
+
+# Precompiled pattern matching the parts of an HTML source where tags are not
+# markup: comments, CDATA sections and the raw text of script, style and
+# textarea elements
+_NON_MARKUP_RE: Pattern[str] = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<!\[CDATA\[.*?(?:\]\]>|\Z)"
+    r"|<(script|style|textarea)\b.*?(?:</\1\s*>|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Precompiled pattern locating the empty .slides container in the base template
+_SLIDES_DIV_RE: Pattern[str] = re.compile(r'(<div class="slides">)\s*</div>', re.DOTALL)
+
+# Translation table escaping the characters that are special in HTML text and
+# attribute values, applied in a single C-level str.translate pass
+_HTML_ESCAPE_TABLE: Dict[int, str] = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+)
+
+# Output formatter equivalent to BeautifulSoup's "minimal" formatter, which
+# escapes the same characters through a regex with a Python callback per match
+HTML_FORMATTER: HTMLFormatter = HTMLFormatter(
+    entity_substitution=lambda text: text.translate(_HTML_ESCAPE_TABLE)
+)
+
+# JavaScript injected in live reload mode, listening for reload events pushed
+# by the server. Falls back to polling /reload-check every second when
+# Server-Sent Events are unavailable or the stream is held back by a
+# buffering proxy (no "ready" event within a few seconds). The first poll only
+# records the server's reload generation, later polls send it back
+LIVE_RELOAD_SCRIPT: str = """
     <script>
     (function() {
-        let lastReloadTime = Date.now();
-        
+        let generation = null;
+
         function checkForReload() {
-            fetch('/reload-check?' + lastReloadTime)
+            const query = generation === null ? '' : '?generation=' + generation;
+            fetch('/reload-check' + query)
                 .then(response => response.json())
                 .then(data => {
                     if (data.reload) {
                         window.location.reload();
                     }
+                    generation = data.generation;
                 })
                 .catch(() => {
                     // Server might be restarting, silently ignore and retry
@@ -88,68 +136,496 @@ def inject_live_reload_script(html_content: str) -> str:
                     setTimeout(checkForReload, 1000);
                 });
         }
-        
-        // Start polling after page loads
-        setTimeout(checkForReload, 1000);
+
+        if (!window.EventSource) {
+            checkForReload();
+            return;
+        }
+
+        const source = new EventSource('/reload-events');
+        const fallback = setTimeout(() => {
+            source.close();
+            checkForReload();
+        }, 5000);
+        source.addEventListener('ready', () => clearTimeout(fallback));
+        source.onmessage = () => window.location.reload();
     })();
     </script>
     """
 
+# Condition used to wake the Server-Sent Events streams of all connected
+# browsers, and a counter identifying the latest reload signal. Polling pages
+# compare the counter with the value they saw on their previous poll
+reload_condition: threading.Condition = threading.Condition()
+reload_generation: int = 0
+
+# Seconds between keepalive comments sent on idle Server-Sent Events streams
+# so that closed browser tabs are detected and their threads released
+SSE_KEEPALIVE_INTERVAL: float = 15.0
+
+# Signature identifying a version of a file: (mtime in nanoseconds, size)
+FileSignature = Tuple[int, int]
+
+# Cache of file contents keyed by path, storing the signature the contents
+# were read with so unchanged files are not re-read on rebuild
+file_cache: Dict[str, Tuple[FileSignature, str]] = {}
+
+# Cache of processed slide HTML keyed by the slide's index.html path, storing
+# the signatures of every file the slide was built from (None if missing)
+slide_cache: Dict[str, Tuple[Dict[str, Optional[FileSignature]], str]] = {}
+
+# Cache of base templates split around their .slides container, keyed by path
+# and storing the signature of the template the split was computed from
+template_cache: Dict[str, Tuple[FileSignature, Optional[Tuple[str, str, str]]]] = {}
+
+# The caches above are only read and assigned whole entries, which is atomic,
+# so slides can be built concurrently without locking. Two threads missing the
+# same entry at once merely both compute it
+
+# Worker threads building slide folders, kept across rebuilds so that a rebuild
+# served mostly from slide_cache does not pay for starting new threads. The
+# workers overlap blocking file I/O and GIL-releasing parses, which does not
+# depend on the number of cores, and are only started as slides need them
+slide_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="autoreveal-slide"
+)
+
+
+def file_signature(path: str) -> Optional[FileSignature]:
+    """
+    Return a cheap signature identifying the current version of a file.
+
+    Args:
+        path: Path of the file to inspect.
+
+    Returns:
+        A (mtime in nanoseconds, size) tuple, or None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def read_file_cached(path: str) -> Tuple[Optional[FileSignature], str]:
+    """
+    Read a text file, reusing the cached contents if it has not changed.
+
+    The file is only read from disk when its modification time or size
+    differs from the ones recorded the last time it was read. It is read in
+    binary mode and decoded as UTF-8 in one go, the encoding the output is
+    written with, instead of through the incremental text I/O layer.
+
+    Args:
+        path: Path of the file to read.
+
+    Returns:
+        The signature the file was read with (None if it could not be
+        determined) and the contents of the file. Both are returned together
+        so that callers never pair the contents with a signature refreshed
+        in between by another thread.
+    """
+    signature = file_signature(path)
+    cached = file_cache.get(path)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached
+
+    with open(path, "rb") as f:
+        content = f.read().decode("utf-8")
+    # Translate line endings like text mode does, a no-op scan for LF-only files
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    if signature is not None:
+        file_cache[path] = (signature, content)
+    return signature, content
+
+
+def inject_live_reload_script(html_content: str) -> str:
+    """
+    Inject a live reload script into the HTML content.
+
+    This function adds the LIVE_RELOAD_SCRIPT JavaScript snippet, which
+    subscribes to the server's /reload-events Server-Sent Events stream.
+    When a reload event is received, the page automatically refreshes.
+    EventSource reconnects on its own if the server restarts.
+
+    build_slides splices the script in at a cached position instead; this
+    function is used for templates without a .slides container.
+
+    Args:
+        html_content: The HTML content to inject the script into.
+
+    Returns:
+        The modified HTML content with the live reload script injected before
+        the closing </body> tag.
+    """
     # Insert the script before the closing </body> tag
-    return html_content.replace("</body>", f"{live_reload_script}</body>")
+    return html_content.replace("</body>", f"{LIVE_RELOAD_SCRIPT}</body>")
 
 
 def notify_reload() -> None:
     """
     Signal that a reload should happen in all connected browsers.
 
-    Sets the global reload flag which will be picked up by the next
-    polling request from the browser's live reload script.
+    Wakes every open /reload-events stream so that the browsers reload
+    immediately. Pages polling /reload-check see the new reload generation
+    on their next request.
     """
-    reload_flag.set()
+    global reload_generation
+    with reload_condition:
+        reload_generation += 1
+        reload_condition.notify_all()
     print("Reload signal sent")
 
 
-class ReloadHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+class SendfileHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Static file request handler that sends files with zero-copy sendfile(2).
+
+    SimpleHTTPRequestHandler copies files to the socket through user-space
+    buffers. This handler lets the kernel copy them straight from the page
+    cache to the socket instead, which matters for large slide assets such
+    as images and videos.
+    """
+
+    def copyfile(self, source: BinaryIO, outputfile: BinaryIO) -> None:
+        """
+        Copy the file to the client, using sendfile(2) when writing to the socket.
+
+        socket.sendfile() falls back to plain send() calls on its own when
+        sendfile is not available on the platform or for the given file.
+
+        Args:
+            source: The opened file to send.
+            outputfile: The stream to write the file to.
+        """
+        if outputfile is not self.wfile:
+            super().copyfile(source, outputfile)
+            return
+
+        # Make sure buffered headers are written before the file contents
+        outputfile.flush()
+        self.connection.sendfile(source)
+
+
+class ReloadHTTPRequestHandler(SendfileHTTPRequestHandler):
     """
     Custom HTTP request handler that supports live reload functionality.
 
-    Extends SimpleHTTPRequestHandler to add a special endpoint for checking
-    reload status. When browsers poll the /reload-check endpoint, this handler
-    responds with the current reload status.
+    Extends SendfileHTTPRequestHandler to add special endpoints for reload
+    notifications. Browsers subscribe to the /reload-events Server-Sent Events
+    stream, which pushes an event whenever a reload is signalled. Pages that
+    cannot use the stream poll the /reload-check endpoint instead.
     """
 
+    # Send the tiny reload responses and event frames right away instead of
+    # letting Nagle's algorithm hold them back waiting for more data
+    disable_nagle_algorithm = True
+
     def do_GET(self) -> None:
         """
-        Handle GET requests, including the special /reload-check endpoint.
+        Handle GET requests, including the special reload endpoints.
 
-        If the request is for /reload-check, respond with JSON indicating
-        whether a reload should occur. Otherwise, delegate to the parent
-        class's file serving functionality.
+        If the request is for /reload-events, stream reload events to the
+        browser. If the request is for /reload-check, respond with JSON
+        indicating whether a reload was signalled since the generation given
+        in the query string, along with the current generation. Otherwise,
+        delegate to the parent class's file serving functionality.
         """
-        if self.path.startswith("/reload-check"):
+        if self.path == "/reload-events":
+            self.send_reload_events()
+        elif self.path.startswith("/reload-check"):
             # Respond to the reload check with JSON
             self.send_response(200)
             self.send_header("Content-type", "application/json")
             self.send_header("Access-Control-Allow-Origin", "*")
             self.end_headers()
 
-            # Check if reload flag is set, then clear it
-            should_reload = reload_flag.is_set()
-            if should_reload:
-                reload_flag.clear()
+            # Compare the generation the page saw last with the current one.
+            # The first poll of a page has none and only records it
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+            seen = query.get("generation")
+            with reload_condition:
+                generation = reload_generation
+            should_reload = seen is not None and seen[0] != str(generation)
 
             # Send JSON response indicating whether reload is needed
-            response = json.dumps({"reload": should_reload})
+            response = json.dumps({"reload": should_reload, "generation": generation})
             self.wfile.write(response.encode())
         else:
             # Delegate to parent class for normal file serving
             super().do_GET()
 
+    def end_headers(self) -> None:
+        """
+        Ask browsers to revalidate served files before reusing them.
+
+        Without an explicit policy browsers cache files heuristically from
+        their Last-Modified date, so a live reload could show a stale image or
+        stylesheet. With "no-cache" an unchanged file is answered with a
+        bodiless 304 Not Modified response instead of being sent again.
+        """
+        # The event stream sets its own caching headers. Errors for malformed
+        # request lines are sent before the path is parsed
+        if getattr(self, "path", "") != "/reload-events":
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    def send_reload_events(self) -> None:
+        """
+        Stream reload notifications to the browser as Server-Sent Events.
+
+        A "ready" event is sent as soon as the stream opens, letting the
+        browser tell a working stream from one held back by a buffering
+        proxy. The handler then blocks until a reload is signalled, sends a
+        single event frame and keeps waiting for the next one. Keepalive
+        comments are sent while idle so that a closed connection is noticed
+        and the loop exits.
+        """
+        self.send_response(200)
+        self.send_header("Content-type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        # Ask reverse proxies such as nginx not to buffer the stream
+        self.send_header("X-Accel-Buffering", "no")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        with reload_condition:
+            last_generation = reload_generation
+
+        try:
+            self.wfile.write(b"event: ready\ndata: ready\n\n")
+            self.wfile.flush()
+
+            while True:
+                with reload_condition:
+                    reload_condition.wait_for(
+                        lambda: reload_generation != last_generation,
+                        timeout=SSE_KEEPALIVE_INTERVAL,
+                    )
+                    current_generation = reload_generation
 
-def process_loads(soup: BeautifulSoup, base_dir: str) -> None:
+                if current_generation != last_generation:
+                    last_generation = current_generation
+                    self.wfile.write(b"data: reload\n\n")
+                else:
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+        except ConnectionError:
+            # The browser closed the connection (page reloaded or tab closed)
+            pass
+
+
+def unwrap_fragment(soup: BeautifulSoup) -> BeautifulSoup:
     """
-    Recursively process all elements with data-load or data-load-code attributes.
+    Remove the implicit <html>, <head> and <body> wrappers from a parsed fragment.
+
+    The lxml parser wraps fragments in these elements, while html.parser keeps
+    the markup as-is. Unwrapping them in place lets both parsers yield the
+    fragment's nodes, in source order, as the direct children of the soup.
+
+    Args:
+        soup: BeautifulSoup object containing a parsed HTML fragment.
+
+    Returns:
+        The same BeautifulSoup object, for convenient chaining.
+    """
+    # Only the top of the tree is searched, the wrappers are never nested
+    html_tag = soup.find("html", recursive=False)
+    if html_tag is not None:
+        for name in ("head", "body"):
+            wrapper = html_tag.find(name, recursive=False)
+            if wrapper is not None:
+                wrapper.unwrap()
+        html_tag.unwrap()
+    return soup
+
+
+def has_body_tag(html_content: str) -> bool:
+    """
+    Check whether an HTML source contains an actual <body> tag.
+
+    A <body> mentioned in a comment, a CDATA section or a script does not
+    count. The source is only stripped of those parts if it mentions <body>
+    at all.
+
+    Args:
+        html_content: The HTML source to inspect.
+
+    Returns:
+        True if the source has a <body> tag outside comments and raw text.
+    """
+    if not _BODY_TAG_RE.search(html_content):
+        return False
+    return _BODY_TAG_RE.search(_NON_MARKUP_RE.sub("", html_content)) is not None
+
+
+def parse_include(loaded_content: str, load_path: str) -> BeautifulSoup:
+    """
+    Parse an HTML file included with data-load.
+
+    Relative (./) paths in src, data-load and data-load-code attributes are
+    first rewritten to be relative to the included file's directory.
+
+    Parsed trees are not cached: copying a cached tree, which callers would
+    need since they move its nodes into another tree, is about as slow as
+    parsing the file again with lxml.
+
+    Args:
+        loaded_content: Contents of the included file.
+        load_path: Path of the included file as written in the attribute.
+
+    Returns:
+        The parsed include.
+    """
+    # For HTML files, adjust relative paths to maintain correct references
+    # Replace ./ in src, data-load and data-load-code attributes
+    # with proper relative path. A replacement template is expanded
+    # without calling back into Python for every match
+    template = os.path.dirname(load_path).replace("\\", "\\\\")
+    loaded_content = _REL_PATH_RE.sub(
+        rf'\g<1>="{template}/\g<2>"',
+        loaded_content,
+    )
+    return BeautifulSoup(loaded_content, HTML_PARSER)
+
+
+# Nested data-load and data-load-code elements queued for processing
+LoadQueue = List[Tuple[Tag, str]]
+
+# Function inserting a loaded file into an element:
+# (soup, elem, loaded_content, load_path) -> nested loads
+LoadHandler = Callable[[BeautifulSoup, Tag, str, str], LoadQueue]
+
+
+def find_loads(root: BeautifulSoup) -> LoadQueue:
+    """Find all data-load and data-load-code elements under root."""
+    return [
+        (elem, attr)
+        for attr in ("data-load", "data-load-code")
+        for elem in root.find_all(attrs={attr: True})
+    ]
+
+
+def load_html(
+    soup: BeautifulSoup, elem: Tag, loaded_content: str, load_path: str
+) -> LoadQueue:
+    """
+    Replace an element's contents with an included HTML file.
+
+    Args:
+        soup: BeautifulSoup object of the document being processed.
+        elem: Element carrying the data-load attribute.
+        loaded_content: Contents of the loaded file.
+        load_path: Path of the loaded file as written in the attribute.
+
+    Returns:
+        The data-load and data-load-code elements nested in the inserted content.
+    """
+    # Parse the loaded HTML content, with adjusted relative paths
+    loaded_soup = parse_include(loaded_content, load_path)
+
+    # Queue nested data-load attributes found in the loaded content
+    nested = find_loads(loaded_soup)
+
+    # Replace the element's contents with loaded content
+    # lxml always creates a <body>, so it is only used if the source has one
+    elem.clear()
+    body = loaded_soup.body
+    if body is not None and has_body_tag(loaded_content):
+        # If there's a body tag, use only its contents
+        elem.extend(body.contents)
+    else:
+        # Otherwise use all contents
+        elem.extend(unwrap_fragment(loaded_soup).contents)
+    return nested
+
+
+def load_mermaid(
+    soup: BeautifulSoup, elem: Tag, loaded_content: str, load_path: str
+) -> LoadQueue:
+    """
+    Replace an element's contents with the containers of a Mermaid diagram.
+
+    Arguments and return value are the same as for load_html.
+    """
+    # For Mermaid diagrams, create special container structure
+    # Hidden span contains the diagram source, div is the render target
+    if "<" in loaded_content or "&" in loaded_content:
+        # Parse markup and character references in the source like a browser,
+        # e.g. <br> line breaks in node labels
+        diagram_html = f"""<span class="diagram-data" style="display: none">{loaded_content}</span><div class="diagram-display"></div>"""
+        diagram_soup = BeautifulSoup(diagram_html, HTML_PARSER)
+        nested = find_loads(diagram_soup)
+
+        elem.clear()
+        elem.extend(unwrap_fragment(diagram_soup).contents)
+        return nested
+
+    # Plain text sources, the common case, are inserted without parsing
+    data_elem = soup.new_tag(
+        "span", attrs={"class": "diagram-data", "style": "display: none"}
+    )
+    data_elem.string = loaded_content
+
+    elem.clear()
+    elem.append(data_elem)
+    elem.append(soup.new_tag("div", attrs={"class": "diagram-display"}))
+    return []
+
+
+def load_code(
+    soup: BeautifulSoup, elem: Tag, loaded_content: str, load_path: str
+) -> LoadQueue:
+    """
+    Replace an element's contents with a syntax highlighted code block.
+
+    Arguments and return value are the same as for load_html.
+    """
+    # Wrap in appropriate syntax highlighting tags
+    ext = os.path.splitext(load_path)[1].lower()
+    lang = extension_to_lang.get(ext, ext[1:] if ext else "text")
+    # Build the tags directly; the text is escaped on serialization
+    pre_elem = soup.new_tag("pre")
+    code_elem = soup.new_tag("code", attrs={"class": f"language-{lang}"})
+    code_elem.string = loaded_content
+    pre_elem.append(code_elem)
+
+    # Propagate data-* attributes from source element to the code element
+    # This preserves attributes like data-line-numbers, data-trim, etc.
+    for attr_name, attr_value in elem.attrs.items():
+        # Copy all data-* attributes except data-load-code
+        if attr_name.startswith("data-") and attr_name != "data-load-code":
+            code_elem[attr_name] = attr_value
+
+    elem.clear()
+    elem.append(pre_elem)
+    return []
+
+
+# Handlers inserting the files loaded with data-load, by file extension.
+# Files loaded with data-load-code are always shown as code with load_code
+data_load_handlers: Dict[str, LoadHandler] = {
+    ".html": load_html,
+    ".mermaid": load_mermaid,
+}
+
+# Extensions of the files whose changes always require a rebuild: slides, the
+# base template and data-load includes. Files shown with data-load-code are
+# found through the dependencies recorded in slide_cache instead, so that other
+# files, such as stylesheets and scripts fetched by the browser, only require a
+# reload
+BUILD_EXTENSIONS: FrozenSet[str] = frozenset(data_load_handlers)
+
+
+def process_loads(
+    soup: BeautifulSoup,
+    base_dir: str,
+    dependencies: Optional[Dict[str, Optional[FileSignature]]] = None,
+) -> None:
+    """
+    Process all elements with data-load or data-load-code attributes, including nested ones.
 
     This function finds all elements with data-load or data-load-code attributes
     and loads content from the specified file:
@@ -157,122 +633,192 @@ def process_loads(soup: BeautifulSoup, base_dir: str) -> None:
     data-load behavior (smart loading):
     - .html files: Parse and include content, adjusting relative paths
     - .mermaid files: Wrap in diagram containers for Mermaid rendering
-    - Other files: Wrap in <pre><code> with syntax highlighting
+    - Other files: Left untouched
 
     data-load-code behavior (always show as code):
     - ALL files (including .html and .mermaid): Wrap in <pre><code> with syntax highlighting
     - Use this when you want to display the source code of HTML/Mermaid files
 
-    The function is called recursively to handle nested data-load attributes.
+    Elements are processed from a work queue: whenever loaded content is
+    inserted, only the new subtree is searched for nested data-load and
+    data-load-code attributes, so already-processed parts of the document
+    are never traversed again. The content is inserted by the handler looked
+    up in data_load_handlers, or by load_code for data-load-code. Loads of a
+    file that is already being included further up are skipped with a
+    warning, so circular includes cannot grow the document forever.
 
     Args:
         soup: BeautifulSoup object containing the parsed HTML to process.
         base_dir: Base directory path for resolving relative file paths.
+        dependencies: Optional dict collecting the path of every file looked up
+            while processing, mapped to the signature of the version that was
+            used (None if the file does not exist).
     """
-    changed = False
-
-    # Find all elements with data-load or data-load-code attribute
-    for elem in soup.find_all(attrs={"data-load": True}):
-        load_path = elem.get("data-load")
-        is_code_load = False  # This is a regular data-load
-
-        if load_path:
-            full_path = os.path.join(base_dir, load_path)
-            if os.path.exists(full_path):
-                # Read the content from the external file
-                with open(full_path, "r") as f:
-                    loaded_content = f.read()
-
-                ext = os.path.splitext(load_path)[1].lower()
-
-                # For regular data-load, use smart loading based on file type
-                if ext == ".html":
-                    # For HTML files, adjust relative paths to maintain correct references
-                    # Replace ./ in src attributes with proper relative path
-                    loaded_content = re.sub(
-                        r'src="\./([^"]*)"',
-                        lambda m: f'src="{os.path.dirname(load_path)}/{m.group(1)}"',
-                        loaded_content,
-                    )
-                    # Replace ./ in data-load attributes with proper relative path
-                    loaded_content = re.sub(
-                        r'data-load="\./([^"]*)"',
-                        lambda m: f'data-load="{os.path.dirname(load_path)}/{m.group(1)}"',
-                        loaded_content,
-                    )
-                    # Replace ./ in data-load-code attributes with proper relative path
-                    loaded_content = re.sub(
-                        r'data-load-code="\./([^"]*)"',
-                        lambda m: f'data-load-code="{os.path.dirname(load_path)}/{m.group(1)}"',
-                        loaded_content,
-                    )
 
-                    # Parse the loaded HTML content
-                    loaded_soup = BeautifulSoup(loaded_content, "html.parser")
-
-                    # Replace the element's contents with loaded content
-                    elem.clear()
-                    if loaded_soup.body:
-                        # If there's a body tag, use only its contents
-                        elem.extend(loaded_soup.body.contents)
-                    else:
-                        # Otherwise use all contents
-                        elem.extend(loaded_soup.contents)
-                    del elem["data-load"]
-                    changed = True
-
-                elif ext == ".mermaid":
-                    # For Mermaid diagrams, create special container structure
-                    # Hidden span contains the diagram source, div is the render target
-                    diagram_html = f"""<span class="diagram-data" style="display: none">{loaded_content}</span><div class="diagram-display"></div>"""
-                    diagram_soup = BeautifulSoup(diagram_html, "html.parser")
-
-                    elem.clear()
-                    elem.extend(diagram_soup.contents)
-                    del elem["data-load"]
-                    changed = True
+    def is_attached(elem: Tag) -> bool:
+        """Check whether elem is still part of the document being processed."""
+        parent = elem.parent
+        while parent is not None:
+            if parent is soup:
+                return True
+            parent = parent.parent
+        return False
+
+    # Each queued element carries the chain of files whose inclusion led to it
+    no_ancestors: FrozenSet[str] = frozenset()
+    pending: Deque[Tuple[Tag, str, FrozenSet[str]]] = collections.deque(
+        (elem, attr, no_ancestors) for elem, attr in find_loads(soup)
+    )
 
-                else:
-                    pass
-
-    # Process data-load-code attributes (always treat as code)
-    for elem in soup.find_all(attrs={"data-load-code": True}):
-        load_path = elem.get("data-load-code")
-
-        if load_path:
-            full_path = os.path.join(base_dir, load_path)
-            if os.path.exists(full_path):
-                # Read the content from the external file
-                with open(full_path, "r") as f:
-                    loaded_content = f.read()
-
-                ext = os.path.splitext(load_path)[1].lower()
-
-                # Always treat as code - wrap in appropriate syntax highlighting tags
-                lang = extension_to_lang.get(ext, ext[1:] if ext else "text")
-                code_content = f'<pre><code class="language-{lang}">{html.escape(loaded_content)}</code></pre>'
-                code_soup = BeautifulSoup(code_content, "html.parser")
-
-                # Propagate data-* attributes from source element to the code element
-                # This preserves attributes like data-line-numbers, data-trim, etc.
-                code_elem = code_soup.find("code")
-                if code_elem:
-                    for attr_name, attr_value in elem.attrs.items():
-                        # Copy all data-* attributes except data-load-code
-                        if (
-                            attr_name.startswith("data-")
-                            and attr_name != "data-load-code"
-                        ):
-                            code_elem[attr_name] = attr_value
-
-                elem.clear()
-                elem.extend(code_soup.contents)
-                del elem["data-load-code"]
-                changed = True
-
-    # If any changes were made, recursively process again for nested data-load attributes
-    if changed:
-        process_loads(soup, base_dir)
+    while pending:
+        elem, attr, ancestors = pending.popleft()
+        load_path = elem.get(attr)
+        if not load_path:
+            continue
+
+        # data-load only handles HTML and Mermaid files, leave others untouched
+        if attr == "data-load":
+            handler = data_load_handlers.get(os.path.splitext(load_path)[1].lower())
+            if handler is None:
+                continue
+        else:
+            handler = load_code
+
+        # Skip elements removed from the document since they were queued,
+        # e.g. nested inside an element whose contents were replaced
+        if not is_attached(elem):
+            continue
+
+        full_path = os.path.join(base_dir, load_path)
+        # A file including itself, directly or through other files, would
+        # keep growing the document forever
+        chain_path = os.path.normpath(full_path)
+        if chain_path in ancestors:
+            print(f"Warning: circular data-load of {load_path} skipped")
+            continue
+        if not os.path.isfile(full_path):
+            if dependencies is not None:
+                dependencies[full_path] = file_signature(full_path)
+            continue
+
+        # Read the content from the external file and insert it
+        signature, loaded_content = read_file_cached(full_path)
+        if dependencies is not None:
+            dependencies[full_path] = signature
+        nested_ancestors = ancestors | {chain_path}
+        pending.extend(
+            (nested_elem, nested_attr, nested_ancestors)
+            for nested_elem, nested_attr in handler(
+                soup, elem, loaded_content, load_path
+            )
+        )
+        del elem[attr]
+
+
+def split_base_template(base_html_path: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split the base HTML template around the contents of its .slides div.
+
+    The part following the slides is further split at the closing </body>
+    tag, which is where the live reload script goes. The split is cached
+    until the template changes, so rebuilds only have to concatenate the
+    parts instead of searching the template again.
+
+    Args:
+        base_html_path: Path to the base HTML template file.
+
+    Returns:
+        The (prefix, suffix, body_end) parts, where the slides go between
+        prefix and suffix and body_end starts at the closing </body> tag
+        (empty if there is none), or None if the template has no empty
+        .slides div.
+    """
+    signature, base_content = read_file_cached(base_html_path)
+    cached = template_cache.get(base_html_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    match = _SLIDES_DIV_RE.search(base_content)
+    split = None
+    if match:
+        suffix = "\n</div>" + base_content[match.end() :]
+        body_end = suffix.find("</body>")
+        if body_end == -1:
+            body_end = len(suffix)
+        split = (
+            base_content[: match.end(1)] + "\n",
+            suffix[:body_end],
+            suffix[body_end:],
+        )
+    if signature is not None:
+        template_cache[base_html_path] = (signature, split)
+    return split
+
+
+def build_slide(
+    base_path: str, slides_dir: str, slides_dir_name: str, folder: str
+) -> Optional[str]:
+    """
+    Build the HTML of a single slide folder.
+
+    Loads the folder's index.html, adjusts relative paths for resources and
+    processes data-load and data-load-code attributes. The result is cached
+    and reused as long as none of the files it was built from changes.
+
+    Args:
+        base_path: Root directory of the project.
+        slides_dir: Directory containing slide subdirectories.
+        slides_dir_name: Name of the slides directory, used to build relative paths.
+        folder: Name of the slide folder inside slides_dir.
+
+    Returns:
+        The processed slide HTML, or None if the folder has no index.html.
+    """
+    index_path = os.path.join(slides_dir, folder, "index.html")
+
+    # Reuse the processed slide if none of the files it was built from changed
+    # A removed index.html changes its signature, so it never hits the cache
+    cached = slide_cache.get(index_path)
+    if cached is not None and all(
+        file_signature(path) == signature for path, signature in cached[0].items()
+    ):
+        return cached[1]
+
+    # Load the slide's index.html, without a separate existence check
+    try:
+        signature, slide_content = read_file_cached(index_path)
+    except FileNotFoundError:
+        return None
+    dependencies: Dict[str, Optional[FileSignature]] = {index_path: signature}
+
+    # Adjust relative paths (./) to be relative to the slides folder
+    # This ensures resources like images and videos load correctly
+    # The rewrite works on the raw text in a single pass rather than on parsed
+    # attributes: it also covers data-src (lazy-loaded media) and markup inside
+    # markdown <textarea> templates, and most slides are never parsed at all
+    # Backslashes in the folder path are escaped so that the replacement
+    # template only ever expands the two group references
+    prefix = f"{slides_dir_name}/{folder}".replace("\\", "\\\\")
+    slide_content = _REL_PATH_RE.sub(
+        rf'\g<1>="{prefix}/\g<2>"',
+        slide_content,
+    )
+
+    # Process data-load attributes recursively to inline external content
+    # Slides without any data-load attribute are used as-is, skipping the
+    # parse and serialization roundtrip
+    if "data-load" in slide_content:
+        soup = BeautifulSoup(slide_content, HTML_PARSER)
+        process_loads(soup, base_path, dependencies)
+        slide_content = unwrap_fragment(soup).decode(formatter=HTML_FORMATTER)
+
+    # Only cache the slide if none of its files changed since they were read
+    if all(
+        file_signature(path) == signature for path, signature in dependencies.items()
+    ):
+        slide_cache[index_path] = (dependencies, slide_content)
+
+    return slide_content
 
 
 def build_slides(
@@ -302,77 +848,188 @@ def build_slides(
         output_html_path: Path where the built index.html will be written.
         enable_live_reload: Whether to inject live reload functionality.
     """
-    # Read the base HTML template
-    with open(base_html_path, "r") as f:
-        base_content = f.read()
-
     # Get all subdirectories in slides folder, sorted alphabetically
-    # This ensures slides appear in a predictable order
-    subfolders = sorted(
-        [
-            d
-            for d in os.listdir(slides_dir)
-            if os.path.isdir(os.path.join(slides_dir, d))
-        ]
-    )
+    # This ensures slides appear in a predictable order. os.scandir reports
+    # entry types from the directory listing, without a stat per entry
+    with os.scandir(slides_dir) as entries:
+        subfolders = sorted(entry.name for entry in entries if entry.is_dir())
 
-    slides_content = ""
     # Extract the directory name from slides_dir for relative path construction
     slides_dir_name = os.path.basename(slides_dir)
 
-    for folder in subfolders:
-        index_path = os.path.join(slides_dir, folder, "index.html")
-        if os.path.exists(index_path):
-            # Load the slide's index.html
-            with open(index_path, "r") as f:
-                slide_content = f.read()
-
-            # Adjust relative paths (./) to be relative to the slides folder
-            # This ensures resources like images and videos load correctly
-            slide_content = re.sub(
-                r'src="\./([^"]*)"',
-                rf'src="{slides_dir_name}/{folder}/\1"',
-                slide_content,
-            )
-            slide_content = re.sub(
-                r'data-load="\./([^"]*)"',
-                rf'data-load="{slides_dir_name}/{folder}/\1"',
-                slide_content,
-            )
-            slide_content = re.sub(
-                r'data-load-code="\./([^"]*)"',
-                rf'data-load-code="{slides_dir_name}/{folder}/\1"',
-                slide_content,
-            )
-
-            # Process data-load attributes recursively to inline external content
-            soup = BeautifulSoup(slide_content, "html.parser")
-            process_loads(soup, base_path)
-            slide_content = str(soup)
+    # Process the slide folders in parallel; file I/O and parsing with lxml
+    # release the GIL, and map() keeps the results in alphabetical order
+    slides = list(
+        slide_executor.map(
+            functools.partial(build_slide, base_path, slides_dir, slides_dir_name),
+            subfolders,
+        )
+    )
 
+    slides_parts: List[str] = []
+    for folder, slide_content in zip(subfolders, slides):
+        if slide_content is not None:
             # Accumulate all slide content
-            slides_content += slide_content
+            slides_parts.append(slide_content)
         else:
             print(f"Warning: index.html not found in {folder}")
+    # Separate slides with a newline to keep the built HTML readable
+    slides_content = "\n".join(slides_parts)
 
     # Insert all slides into the base template's .slides div
-    # Use lambda to avoid issues with backslashes in LaTeX/math equations
-    base_content = re.sub(
-        r'(<div class="slides">)\s*</div>',
-        lambda m: f"{m.group(1)}\n{slides_content}\n</div>",
-        base_content,
-        flags=re.DOTALL,
+    # Concatenate them between the cached template parts instead of using
+    # re.sub, which avoids issues with backslashes in LaTeX/math equations
+    template_parts = split_base_template(base_html_path)
+    if template_parts is not None:
+        prefix, suffix, body_end = template_parts
+        # Inject live reload script before </body> if enabled for development
+        live_reload_script = (
+            LIVE_RELOAD_SCRIPT if enable_live_reload and body_end else ""
+        )
+        base_content = "".join(
+            (prefix, slides_content, suffix, live_reload_script, body_end)
+        )
+    else:
+        base_content = read_file_cached(base_html_path)[1]
+
+        # Inject live reload script if enabled for development
+        if enable_live_reload:
+            base_content = inject_live_reload_script(base_content)
+
+    # Write the final presentation HTML to a temporary file and atomically
+    # move it into place, so that a browser reloading concurrently never sees
+    # a truncated file. Skip the write if the output did not change
+    data = base_content.encode("utf-8")
+    try:
+        with open(output_html_path, "rb") as f:
+            unchanged = f.read() == data
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        tmp_path = output_html_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, output_html_path)
+
+    print(f"Built index.html with slides from {len(subfolders)} folders.")
+
+
+def affects_build(path: str) -> bool:
+    """
+    Check whether a change to a file requires rebuilding the presentation.
+
+    Files with one of the BUILD_EXTENSIONS always do. So does any other file
+    a cached slide was built from, e.g. a .py file shown with data-load-code.
+
+    Args:
+        path: Path of the changed file.
+
+    Returns:
+        True if the presentation must be rebuilt, False if reloading the
+        browser is enough.
+    """
+    if os.path.splitext(path)[1].lower() in BUILD_EXTENSIONS:
+        return True
+    path = os.path.abspath(path)
+    # Copy the entries, slides may be cached by a concurrent rebuild
+    return any(
+        os.path.abspath(dependency) == path
+        for dependencies, _ in list(slide_cache.values())
+        for dependency in dependencies
     )
 
-    # Inject live reload script if enabled for development
-    if enable_live_reload:
-        base_content = inject_live_reload_script(base_content)
 
-    # Write the final presentation HTML
-    with open(output_html_path, "w") as f:
-        f.write(base_content)
+class RebuildEventHandler(FileSystemEventHandler):
+    """
+    Watchdog event handler that rebuilds the presentation when files change.
+
+    Only events for the base HTML template and for files inside the slides
+    directory are taken into account. Bursts of events, such as an editor
+    saving several files at once, are coalesced with a short debounce timer
+    so that a single rebuild is triggered. The rebuild callback is told
+    whether any of the changes affects the build; when only assets such as
+    images were modified, reloading the browser is enough.
+    """
 
-    print(f"Built index.html with slides from {len(subfolders)} folders.")
+    def __init__(
+        self,
+        base_path: str,
+        slides_dir: str,
+        base_html_path: str,
+        rebuild: Callable[[bool], None],
+        debounce: float = 0.25,
+    ) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            base_path: Root directory of the project, used to print relative paths.
+            slides_dir: Directory containing slide subdirectories.
+            base_html_path: Path to the base HTML template file.
+            rebuild: Callback invoked to rebuild the presentation, with whether
+                the build is affected by the changes.
+            debounce: Seconds to wait for further events before rebuilding.
+        """
+        super().__init__()
+        self.base_path = base_path
+        self.slides_dir = os.path.abspath(slides_dir)
+        self.base_html_path = os.path.abspath(base_html_path)
+        self.rebuild = rebuild
+        self.debounce = debounce
+        self._timer: Optional[threading.Timer] = None
+        self._build_pending = False
+        self._timer_lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+
+    def is_watched(self, path: str) -> bool:
+        """Check whether a changed path should trigger a rebuild."""
+        path = os.path.abspath(path)
+        return path == self.base_html_path or path.startswith(self.slides_dir + os.sep)
+
+    def on_any_event(self, event: "FileSystemEvent") -> None:
+        """
+        Schedule a rebuild for relevant create, delete, modify and move events.
+
+        Open/close events (emitted when build_slides itself reads the files)
+        and directory modifications (which accompany file creations and
+        deletions) are ignored.
+        """
+        if event.event_type not in ("created", "deleted", "modified", "moved"):
+            return
+        if event.is_directory and event.event_type == "modified":
+            return
+
+        paths = [event.src_path]
+        if event.event_type == "moved":
+            paths.append(event.dest_path)
+        changed = [str(path) for path in paths if self.is_watched(str(path))]
+        if not changed:
+            return
+
+        for path in changed:
+            print(f"Change detected in: {os.path.relpath(path, self.base_path)}")
+
+        # Added, removed or renamed files may change the slide structure
+        needs_build = event.event_type != "modified" or any(
+            affects_build(path) for path in changed
+        )
+
+        # Restart the debounce timer so a burst of events rebuilds only once
+        with self._timer_lock:
+            self._build_pending = self._build_pending or needs_build
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._run_rebuild)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run_rebuild(self) -> None:
+        """Run the rebuild callback, never running two rebuilds at once."""
+        with self._timer_lock:
+            build = self._build_pending
+            self._build_pending = False
+        with self._rebuild_lock:
+            self.rebuild(build)
 
 
 def watch_files(
@@ -392,7 +1049,9 @@ def watch_files(
     - The slide folder structure itself
 
     When changes are detected, it rebuilds the presentation and optionally
-    triggers a browser reload.
+    triggers a browser reload. If watchdog is installed, changes are reported
+    by the operating system; otherwise, or if the operating system refuses to
+    watch more files, modification times are polled every second.
 
     Args:
         base_path: Root directory of the project.
@@ -405,25 +1064,90 @@ def watch_files(
     if not watch:
         return
 
-    def get_all_files_in_slides() -> List[str]:
-        """Get all files in the slides directory recursively."""
-        all_files = [base_html_path]
-        for root, dirs, files in os.walk(slides_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                all_files.append(file_path)
-        return all_files
+    if WATCHDOG_AVAILABLE:
+
+        def rebuild(build: bool) -> None:
+            """Rebuild the presentation if needed and notify browsers."""
+            if build:
+                print("Rebuilding presentation...")
+                build_slides(
+                    base_path,
+                    slides_dir,
+                    base_html_path,
+                    output_html_path,
+                    enable_live_reload,
+                )
+            else:
+                print("Only assets changed, skipping rebuild")
+            if enable_live_reload:
+                notify_reload()
 
-    # Initial collection of files to monitor
-    files_to_watch = get_all_files_in_slides()
+        handler = RebuildEventHandler(base_path, slides_dir, base_html_path, rebuild)
+        observer = Observer()
+        observer.schedule(handler, slides_dir, recursive=True)
+        # Watch the template's directory, the handler filters out other files
+        observer.schedule(handler, os.path.dirname(base_html_path), recursive=False)
+        try:
+            observer.start()
+        except OSError as e:
+            # e.g. the inotify watch limit (fs.inotify.max_user_watches) is reached
+            print(f"Warning: cannot watch file system events ({e}), polling instead")
+            # Stop the watches that did start, which would otherwise keep
+            # queueing events nobody dispatches. This also joins their
+            # threads; the observer's own thread was never started
+            observer.stop()
+        else:
+            print("Watching slides directory for file system events...")
+            observer.join()
+            return
 
-    # Initial collection of files to monitor
-    files_to_watch = get_all_files_in_slides()
+    def scan_slides() -> Tuple[Dict[str, int], FrozenSet[str]]:
+        """
+        Scan the slides directory recursively.
 
-    # Record initial modification times for all watched files
-    mtimes: Dict[str, float] = {
-        f: os.path.getmtime(f) for f in files_to_watch if os.path.exists(f)
-    }
+        Returns the modification time of every directory and the set of all
+        files to watch, including the base HTML template.
+        """
+        dir_mtimes: Dict[str, int] = {}
+        all_files = [base_html_path]
+        pending_dirs = [slides_dir]
+        while pending_dirs:
+            directory = pending_dirs.pop()
+            try:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            all_files.append(entry.path)
+                        elif not entry.is_symlink():
+                            pending_dirs.append(entry.path)
+            except OSError:
+                # Directory removed while scanning, picked up on the next tick
+                continue
+        return dir_mtimes, frozenset(all_files)
+
+    def dirs_changed(dir_mtimes: Dict[str, int]) -> bool:
+        """Check whether entries were added to or removed from any directory."""
+        for directory, mtime in dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def scan_signatures(files: FrozenSet[str]) -> Dict[str, FileSignature]:
+        """Stat every watched file once, skipping files that no longer exist."""
+        signatures: Dict[str, FileSignature] = {}
+        for f in files:
+            signature = file_signature(f)
+            if signature is not None:
+                signatures[f] = signature
+        return signatures
+
+    # Initial collection of files to monitor, and their signatures
+    dir_mtimes, files_to_watch = scan_slides()
+    mtimes = scan_signatures(files_to_watch)
 
     print(f"Watching {len(files_to_watch)} files in slides directory...")
 
@@ -431,16 +1155,19 @@ def watch_files(
     while True:
         time.sleep(1)
 
-        # Check if files were added or removed
-        current_files = get_all_files_in_slides()
-        if set(current_files) != set(files_to_watch):
+        # Check if files were added or removed. Directory modification times
+        # only change when entries are added or removed, so the file list is
+        # rescanned only when one of them changed
+        if dirs_changed(dir_mtimes):
+            dir_mtimes, current_files = scan_slides()
+        else:
+            current_files = files_to_watch
+        if current_files != files_to_watch:
             print("Files added or removed in slides directory, updating watch list...")
             files_to_watch = current_files
 
-            # Update modification times for the new file list
-            mtimes = {
-                f: os.path.getmtime(f) for f in files_to_watch if os.path.exists(f)
-            }
+            # Update signatures for the new file list
+            mtimes = scan_signatures(files_to_watch)
 
             # Rebuild since files changed
             build_slides(
@@ -454,15 +1181,19 @@ def watch_files(
                 notify_reload()
             continue
 
-        # Check if any watched files have been modified
-        changed = False
+        # Check if any watched files have been modified, with one stat per file.
+        # Slides whose files did not change are reused from slide_cache
+        changed: List[str] = []
         for f in files_to_watch:
-            if os.path.exists(f) and os.path.getmtime(f) != mtimes.get(f, 0):
-                changed = True
-                mtimes[f] = os.path.getmtime(f)
+            signature = file_signature(f)
+            if signature is not None and signature != mtimes.get(f):
+                changed.append(f)
+                mtimes[f] = signature
                 print(f"Change detected in: {os.path.relpath(f, base_path)}")
 
-        if changed:
+        if not changed:
+            continue
+        if any(affects_build(f) for f in changed):
             print("Rebuilding presentation...")
             build_slides(
                 base_path,
@@ -471,8 +1202,10 @@ def watch_files(
                 output_html_path,
                 enable_live_reload,
             )
-            if enable_live_reload:
-                notify_reload()
+        else:
+            print("Only assets changed, skipping rebuild")
+        if enable_live_reload:
+            notify_reload()
 
 
 def main() -> None:
@@ -544,16 +1277,14 @@ def main() -> None:
 
     # Choose appropriate handler based on live reload setting
     handler = (
-        ReloadHTTPRequestHandler
-        if args.live_reload
-        else http.server.SimpleHTTPRequestHandler
+        ReloadHTTPRequestHandler if args.live_reload else SendfileHTTPRequestHandler
     )
 
-    # Allow socket reuse to prevent "Address already in use" errors
-    socketserver.TCPServer.allow_reuse_address = True
-
-    # Start the HTTP server
-    with socketserver.TCPServer(("", args.port), handler) as httpd:
+    # Start the HTTP server, handling each request in its own daemon thread so
+    # that assets load in parallel and open /reload-events streams never block
+    # other requests. HTTPServer already allows socket reuse to prevent
+    # "Address already in use" errors
+    with http.server.ThreadingHTTPServer(("", args.port), handler) as httpd:
         print(
             f"Serving on port {args.port}. Open http://localhost:{args.port}/index.html"
         )